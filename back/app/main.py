@@ -50,6 +50,9 @@ else:
     cors_origins = env_config.cors_allowed_origins
 
 # Initialize Socket.IO server with unified configuration
+# Small latency-critical frames (ack:join, ack:leave, acks) rely on TCP_NODELAY,
+# which asyncio enables on every TCP transport uvicorn accepts; keep any custom
+# server/socket setup from re-enabling Nagle.
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins="*" if "*" in cors_origins else cors_origins,
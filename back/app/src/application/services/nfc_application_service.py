@@ -7,7 +7,7 @@
 import asyncio
 from typing import Dict, List, Optional, Callable, Any, TYPE_CHECKING
 
-from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
+from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier, get_tag_identifier
 from app.src.domain.nfc.services.nfc_association_service import NfcAssociationService
 from app.src.domain.nfc.protocols.nfc_hardware_protocol import (
     NfcHardwareProtocol,
@@ -306,9 +306,9 @@ class NfcApplicationService:
         """Handle tag detection from hardware."""
         # Convert string or dict to TagIdentifier
         if isinstance(tag_data, str):
-            tag_identifier = TagIdentifier(uid=tag_data)
+            tag_identifier = get_tag_identifier(tag_data)
         elif isinstance(tag_data, dict) and "uid" in tag_data:
-            tag_identifier = TagIdentifier(uid=tag_data["uid"])
+            tag_identifier = get_tag_identifier(tag_data["uid"])
         elif hasattr(tag_data, "uid"):
             tag_identifier = tag_data  # Already a TagIdentifier
         else:
@@ -5,10 +5,11 @@
 """NFC Tag Identifier Value Object."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagIdentifier:
     """Value object representing an NFC tag identifier.
 
@@ -51,3 +52,13 @@ class TagIdentifier:
     def __str__(self) -> str:
         """String representation of tag identifier."""
         return self.uid
+
+
+@lru_cache(maxsize=256)
+def get_tag_identifier(uid: str) -> TagIdentifier:
+    """Return a validated TagIdentifier, reusing instances for recently seen UIDs.
+
+    TagIdentifier is immutable, so sharing instances is safe and skips
+    re-running validation for tags that are scanned repeatedly.
+    """
+    return TagIdentifier(uid=uid)
@@ -136,25 +136,25 @@ class ImprovedLogger:
         log_func = getattr(self.logger, _logging.getLevelName(py_level).lower(), self.logger.info)
         log_func(full_message)
 
-    def debug(self, message: str, **kwargs):
-        """Log a debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args, **kwargs):
+        """Log a debug message (``args`` are %-formatted lazily)."""
+        self.logger.debug(message, *args)
 
-    def info(self, message: str, **kwargs):
-        """Log an info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args, **kwargs):
+        """Log an info message (``args`` are %-formatted lazily)."""
+        self.logger.info(message, *args)
 
-    def warning(self, message: str, **kwargs):
-        """Log a warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args, **kwargs):
+        """Log a warning message (``args`` are %-formatted lazily)."""
+        self.logger.warning(message, *args)
 
-    def error(self, message: str, exc_info: Optional[Exception] = None, **kwargs):
-        """Log an error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args, exc_info: Optional[Exception] = None, **kwargs):
+        """Log an error message (``args`` are %-formatted lazily)."""
+        self.logger.error(message, *args)
 
-    def critical(self, message: str, exc_info: Optional[Exception] = None, **kwargs):
-        """Log a critical message."""
-        self.logger.critical(message)
+    def critical(self, message: str, *args, exc_info: Optional[Exception] = None, **kwargs):
+        """Log a critical message (``args`` are %-formatted lazily)."""
+        self.logger.critical(message, *args)
 
     def set_context(self, **context):
         """Set persistent context for this logger.
@@ -10,16 +10,87 @@ state management system. Clients can subscribe to state updates and send
 commands, but never maintain authoritative state.
 """
 
+import asyncio
 import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 import socketio
 
 from app.src.monitoring import get_logger
 from app.src.services.error.unified_error_decorator import handle_http_errors
 from app.src.domain.audio.engine.state_manager import StateManager
+from app.src.domain.nfc.value_objects.tag_identifier import get_tag_identifier
 
 logger = get_logger(__name__)
 
+# Identical nfc_association_state frames to one client within this window are dropped
+_NFC_STATE_DEDUP_WINDOW = 0.25
+
+# Seconds a collected health metrics snapshot is reused across health_check requests
+_HEALTH_METRICS_TTL = 1.0
+
+# Upper bound on override tag detections processed concurrently in the background
+_MAX_CONCURRENT_TAG_DETECTIONS = 16
+
+# Sentinel distinguishing a missing attribute from one set to None
+_MISSING = object()
+
+# Static fields of the override "waiting" state, merged into each emit
+_OVERRIDE_WAITING_STATE = {
+    "state": "waiting",
+    "override_mode": True,
+    "message": "Place NFC tag to override existing association",
+}
+
+
+@dataclass(frozen=True)
+class _NFCLinkRequest:
+    """Validated payload of the start/stop/override NFC link events."""
+
+    playlist_id: str
+    client_op_id: Optional[str] = None
+    tag_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data) -> "_NFCLinkRequest":
+        """Build the request from raw event data.
+
+        Raises:
+            ValueError: If playlist_id is missing
+        """
+        data = data or {}
+        playlist_id = data.get("playlist_id")
+        if not playlist_id:
+            raise ValueError("playlist_id is required")
+        return cls(playlist_id, data.get("client_op_id"), data.get("tag_id"))
+
+
+def _calculate_expires_at(timeout_at: Optional[str], default_timeout: float = 60) -> float:
+    """Convert a session ISO timeout into an epoch timestamp for the frontend countdown."""
+    if timeout_at:
+        return datetime.fromisoformat(timeout_at.replace("Z", "+00:00")).timestamp()
+    return time.time() + default_timeout
+
+
+def _extract_player_state_info(player_state):
+    """Return (data, server_seq, playlist_title) from a PlayerStateModel or a fallback dict."""
+    server_seq = getattr(player_state, "server_seq", _MISSING)
+    if server_seq is not _MISSING:
+        # PlayerStateModel case
+        return (
+            player_state.model_dump(),
+            server_seq,
+            getattr(player_state, "active_playlist_title", None),
+        )
+    # dict case (fallback scenario)
+    return (
+        player_state,
+        player_state.get("server_seq", 0),
+        player_state.get("active_playlist_title", "None"),
+    )
+
 
 class WebSocketStateHandlers:
     """WebSocket handlers for server-authoritative state management."""
@@ -28,12 +99,65 @@ class WebSocketStateHandlers:
         self.sio = sio
         self.app = app
         self.state_manager = state_manager
+        # Bound once: read on every ping, join and sync event
+        self._get_global_seq = state_manager.get_global_sequence
+        # Strong references to in-flight background tasks so they are not GC'd
+        self._background_tasks = set()
+        # Bounds concurrent override tag processing scheduled off the request path
+        self._tag_detection_slots = asyncio.Semaphore(_MAX_CONCURRENT_TAG_DETECTIONS)
+        # Last nfc_association_state sent per client: sid -> (payload key, monotonic time)
+        self._last_nfc_state = {}
+        # Number of connected clients, maintained by connect/disconnect
+        self._connected_clients = 0
+        # Last health metrics snapshot: (metrics, monotonic time collected)
+        self._health_snapshot = None
 
         # Set the Socket.IO server in state manager
         self.state_manager.socketio = sio
 
-        logger.info("WebSocketStateHandlers initialized with server-authoritative architecture",
-        )
+        logger.info("WebSocketStateHandlers initialized with server-authoritative architecture")
+
+    def _spawn(self, coro, description: str) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+
+        def _on_done(done: asyncio.Task):
+            self._background_tasks.discard(done)
+            if not done.cancelled() and done.exception() is not None:
+                logger.error("Error in background %s: %s", description, done.exception())
+
+        task.add_done_callback(_on_done)
+        return task
+
+    async def _guarded_handle_tag(self, nfc_service, tag_identifier):
+        """Process an override tag, limiting how many run concurrently."""
+        async with self._tag_detection_slots:
+            await nfc_service._handle_tag_detection(tag_identifier)
+        logger.info("✅ Override completed automatically for tag %s", tag_identifier)
+
+    async def _emit_nfc_association_state(self, payload: dict, sid: str):
+        """Emit an NFC association state, skipping exact repeats sent moments earlier.
+
+        server_seq is excluded from the comparison so a retried command that
+        only advanced the sequence does not produce a duplicate frame.
+        """
+        key = tuple(sorted((k, v) for k, v in payload.items() if k != "server_seq"))
+        now = time.monotonic()
+        last = self._last_nfc_state.get(sid)
+        if last and last[0] == key and now - last[1] < _NFC_STATE_DEDUP_WINDOW:
+            return
+        self._last_nfc_state[sid] = (key, now)
+        await self.sio.emit("nfc_association_state", payload, room=sid)
+
+    async def _get_health_metrics(self) -> dict:
+        """Return state manager health metrics, collected at most once per TTL."""
+        now = time.monotonic()
+        if self._health_snapshot and now - self._health_snapshot[1] < _HEALTH_METRICS_TTL:
+            return self._health_snapshot[0]
+        metrics = await self.state_manager.get_health_metrics()
+        self._health_snapshot = (metrics, now)
+        return metrics
 
     def register(self):
         """Register all server-authoritative WebSocket event handlers."""
@@ -42,7 +166,8 @@ class WebSocketStateHandlers:
         @handle_http_errors()
         async def connect(sid, environ):
             """Handle client connection and initial state sync."""
-            logger.info(f"Client connected: {sid}")
+            logger.info("Client connected: %s", sid)
+            self._connected_clients += 1
 
             # Send connection acknowledgment with proper error handling
             await self.sio.emit(
@@ -50,7 +175,7 @@ class WebSocketStateHandlers:
                 {
                     "status": "connected",
                     "sid": sid,
-                    "server_seq": self.state_manager.get_global_sequence(),
+                    "server_seq": self._get_global_seq(),
                 },
                 room=sid,
             )
@@ -58,16 +183,19 @@ class WebSocketStateHandlers:
         @self.sio.event
         async def disconnect(sid):
             """Handle client disconnection and cleanup subscriptions."""
-            logger.info(f"Client disconnected: {sid}")
+            logger.info("Client disconnected: %s", sid)
+            self._connected_clients = max(0, self._connected_clients - 1)
+            self._last_nfc_state.pop(sid, None)
 
-            # Unsubscribe client from all rooms
-            await self.state_manager.unsubscribe_client(sid)
+            # Unsubscribe client from all rooms in the background so the
+            # Socket.IO worker is free for the next event immediately
+            self._spawn(self.state_manager.unsubscribe_client(sid), "disconnect cleanup")
 
         @self.sio.on("join:playlists")
         @handle_http_errors()
         async def handle_join_playlists(sid, data):
             """Subscribe client to global playlists state updates."""
-            logger.info(f"Client {sid} joining playlists room")
+            logger.info("Client %s joining playlists room", sid)
             await self.state_manager.subscribe_client(sid, "playlists")
             # Snapshot is sent by StateManager.subscribe_client via _send_state_snapshot
             # Send acknowledgment
@@ -76,12 +204,11 @@ class WebSocketStateHandlers:
                 {
                     "room": "playlists",
                     "success": True,
-                    "server_seq": self.state_manager.get_global_sequence(),
+                    "server_seq": self._get_global_seq(),
                 },
                 room=sid,
             )
-            logger.info(f"Client {sid} subscribed to playlists; snapshot will be sent by StateManager",
-            )
+            logger.info("Client %s subscribed to playlists; snapshot will be sent by StateManager", sid)
 
         @self.sio.on("join:playlist")
         @handle_http_errors()
@@ -91,7 +218,7 @@ class WebSocketStateHandlers:
             if not playlist_id:
                 raise ValueError("playlist_id is required")
             room = f"playlist:{playlist_id}"
-            logger.info(f"Client {sid} joining playlist room: {room}")
+            logger.info("Client %s joining playlist room: %s", sid, room)
             await self.state_manager.subscribe_client(sid, room)
             # Send acknowledgment
             await self.sio.emit(
@@ -109,7 +236,7 @@ class WebSocketStateHandlers:
         @handle_http_errors()
         async def handle_leave_playlists(sid, data):
             """Unsubscribe client from global playlists updates."""
-            logger.info(f"Client {sid} leaving playlists room")
+            logger.info("Client %s leaving playlists room", sid)
             await self.state_manager.unsubscribe_client(sid, "playlists")
             await self.sio.emit("ack:leave", {"room": "playlists", "success": True}, room=sid)
 
@@ -121,7 +248,7 @@ class WebSocketStateHandlers:
             if not playlist_id:
                 raise ValueError("playlist_id is required")
             room = f"playlist:{playlist_id}"
-            logger.info(f"Client {sid} leaving playlist room: {room}")
+            logger.info("Client %s leaving playlist room: %s", sid, room)
             await self.state_manager.unsubscribe_client(sid, room)
             await self.sio.emit(
                 "ack:leave", {"room": room, "playlist_id": playlist_id, "success": True}, room=sid
@@ -135,13 +262,16 @@ class WebSocketStateHandlers:
             if not assoc_id:
                 raise ValueError("assoc_id is required")
             room = f"nfc:{assoc_id}"
-            logger.info(f"Client {sid} joining NFC room: {room}")
+            logger.info("Client %s joining NFC room: %s", sid, room)
             await self.state_manager.subscribe_client(sid, room)
             # Send current snapshot
             container = getattr(self.app, "container", None)
             nfc_service = getattr(container, "nfc", None) if container else None
-            if nfc_service and hasattr(nfc_service, "get_session_snapshot"):
-                snapshot = await nfc_service.get_session_snapshot(assoc_id)
+            # Single lookup: the service is resolved per call since the container
+            # is attached after these handlers are created
+            get_session_snapshot = getattr(nfc_service, "get_session_snapshot", None)
+            if get_session_snapshot is not None:
+                snapshot = await get_session_snapshot(assoc_id)
                 if snapshot:
                     await self.sio.emit("nfc_status", snapshot, room=sid)
             # Ack join
@@ -154,20 +284,25 @@ class WebSocketStateHandlers:
             # Get client's last known sequence numbers
             last_global_seq = data.get("last_global_seq", 0)
             last_playlist_seqs = data.get("last_playlist_seqs", {})
-            logger.info(f"Sync request from {sid}: global_seq={last_global_seq}")
+            logger.info("Sync request from %s: global_seq=%s", sid, last_global_seq)
             # Send current global state if client is behind
-            current_global_seq = self.state_manager.get_global_sequence()
+            current_global_seq = self._get_global_seq()
+            subscriptions = self.state_manager.get_client_subscriptions(sid)
             if last_global_seq < current_global_seq:
-                # Client needs full resync - send snapshots for subscribed rooms
-                subscriptions = self.state_manager.get_client_subscriptions(sid)
-                for room in subscriptions:
-                    await self.state_manager._send_state_snapshot(sid, room)
+                # Client needs full resync - send snapshots for subscribed rooms concurrently
+                results = await asyncio.gather(
+                    *(self.state_manager._send_state_snapshot(sid, room) for room in subscriptions),
+                    return_exceptions=True,
+                )
+                for room, result in zip(subscriptions, results):
+                    if isinstance(result, Exception):
+                        logger.error("Failed to send %s snapshot to %s: %s", room, sid, result)
             # Send sync acknowledgment
             await self.sio.emit(
                 "sync:complete",
                 {
                     "current_global_seq": current_global_seq,
-                    "synced_rooms": list(self.state_manager.get_client_subscriptions(sid)),
+                    "synced_rooms": list(subscriptions),
                 },
                 room=sid,
             )
@@ -180,12 +315,9 @@ class WebSocketStateHandlers:
         @handle_http_errors()
         async def handle_start_nfc_link(sid, data):
             """Handle NFC association start via WebSocket."""
-            playlist_id = data.get("playlist_id")
-            client_op_id = data.get("client_op_id")
-            if not playlist_id:
-                raise ValueError("playlist_id is required")
-            logger.info(f"Starting NFC association for playlist {playlist_id} from client {sid}",
-            )
+            request = _NFCLinkRequest.from_dict(data)
+            playlist_id, client_op_id = request.playlist_id, request.client_op_id
+            logger.info("Starting NFC association for playlist %s from client %s", playlist_id, sid)
             # Get NFC service from container
             container = getattr(self.app, "container", None)
             nfc_service = getattr(container, "nfc", None) if container else None
@@ -194,15 +326,14 @@ class WebSocketStateHandlers:
             # Start association using the service
             result = await nfc_service.start_association_use_case(playlist_id)
             # Emit state update to client
-            await self.sio.emit(
-                "nfc_association_state",
+            await self._emit_nfc_association_state(
                 {
                     "state": "activated",
                     "playlist_id": playlist_id,
                     "expires_at": result.get("expires_at"),
-                    "server_seq": self.state_manager.get_global_sequence(),
+                    "server_seq": self._get_global_seq(),
                 },
-                room=sid,
+                sid,
             )
             # Send acknowledgment if client_op_id provided
             if client_op_id:
@@ -211,19 +342,15 @@ class WebSocketStateHandlers:
                     True,
                     {"assoc_id": result.get("assoc_id"), "playlist_id": playlist_id},
                 )
-            logger.info(f"NFC association started successfully for playlist {playlist_id}"
-            )
+            logger.info("NFC association started successfully for playlist %s", playlist_id)
 
         @self.sio.on("stop_nfc_link")
         @handle_http_errors()
         async def handle_stop_nfc_link(sid, data):
             """Handle NFC association cancellation via WebSocket."""
-            playlist_id = data.get("playlist_id")
-            client_op_id = data.get("client_op_id")
-            if not playlist_id:
-                raise ValueError("playlist_id is required")
-            logger.info(f"Stopping NFC association for playlist {playlist_id} from client {sid}",
-            )
+            request = _NFCLinkRequest.from_dict(data)
+            playlist_id, client_op_id = request.playlist_id, request.client_op_id
+            logger.info("Stopping NFC association for playlist %s from client %s", playlist_id, sid)
             # Get NFC service from container
             container = getattr(self.app, "container", None)
             nfc_service = getattr(container, "nfc", None) if container else None
@@ -233,22 +360,21 @@ class WebSocketStateHandlers:
             # For now, we'll use a simplified approach
             result = await nfc_service.cancel_association_by_playlist(playlist_id)
             # Emit cancelled state
-            await self.sio.emit(
-                "nfc_association_state",
+            await self._emit_nfc_association_state(
                 {
                     "state": "cancelled",
                     "playlist_id": playlist_id,
                     "message": "Association cancelled by user",
-                    "server_seq": self.state_manager.get_global_sequence(),
+                    "server_seq": self._get_global_seq(),
                 },
-                room=sid,
+                sid,
             )
             # Send acknowledgment
             if client_op_id:
                 await self.state_manager.send_acknowledgment(
                     client_op_id, True, {"playlist_id": playlist_id, "status": "cancelled"}
                 )
-            logger.info(f"NFC association cancelled for playlist {playlist_id}")
+            logger.info("NFC association cancelled for playlist %s", playlist_id)
 
         @self.sio.on("override_nfc_tag")
         @handle_http_errors()
@@ -258,13 +384,11 @@ class WebSocketStateHandlers:
             Starts a new association session in override mode and immediately processes
             the tag if tag_id is provided (no need to scan again).
             """
-            playlist_id = data.get("playlist_id")
-            tag_id = data.get("tag_id")  # Get the tag_id from duplicate detection
-            client_op_id = data.get("client_op_id")
-            if not playlist_id:
-                raise ValueError("playlist_id is required")
+            request = _NFCLinkRequest.from_dict(data)
+            playlist_id, client_op_id = request.playlist_id, request.client_op_id
+            tag_id = request.tag_id  # From duplicate detection
 
-            logger.info(f"🔄 Overriding NFC tag {tag_id} for playlist {playlist_id} from client {sid}")
+            logger.info("🔄 Overriding NFC tag %s for playlist %s from client %s", tag_id, playlist_id, sid)
 
             # Get NFC service from application (correct path: app.application._nfc_app_service)
             application = getattr(self.app, "application", None)
@@ -287,39 +411,30 @@ class WebSocketStateHandlers:
             timeout_at = session.get("timeout_at")
 
             # Calculate expires_at timestamp for frontend countdown
-            import time
-            from datetime import datetime, timezone
-            if timeout_at:
-                expires_at = datetime.fromisoformat(timeout_at.replace('Z', '+00:00')).timestamp()
-            else:
-                expires_at = time.time() + 60
+            expires_at = _calculate_expires_at(timeout_at)
 
             # If tag_id is provided, immediately process it (no need to scan again)
             if tag_id:
-                logger.info(f"✅ Processing saved tag {tag_id} immediately for override")
-                from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
-
+                logger.info("✅ Processing saved tag %s immediately for override", tag_id)
                 # Create tag identifier from saved tag_id
-                tag_identifier = TagIdentifier(uid=tag_id)
-
-                # Process the tag immediately for this override session
-                await nfc_service._handle_tag_detection(tag_identifier)
+                tag_identifier = get_tag_identifier(tag_id)
 
-                logger.info(f"✅ Override completed automatically for tag {tag_id}")
+                # Process the tag for this override session without holding up the ack;
+                # the association result is broadcast by the NFC service when done
+                self._spawn(
+                    self._guarded_handle_tag(nfc_service, tag_identifier), "override tag processing"
+                )
             else:
                 # No tag_id provided, emit waiting state (old behavior)
-                await self.sio.emit(
-                    "nfc_association_state",
+                await self._emit_nfc_association_state(
                     {
-                        "state": "waiting",
+                        **_OVERRIDE_WAITING_STATE,
                         "playlist_id": playlist_id,
                         "session_id": session_id,
                         "expires_at": expires_at,
-                        "override_mode": True,
-                        "message": "Place NFC tag to override existing association",
-                        "server_seq": self.state_manager.get_global_sequence(),
+                        "server_seq": self._get_global_seq(),
                     },
-                    room=sid,
+                    sid,
                 )
 
             # Send acknowledgment
@@ -336,19 +451,20 @@ class WebSocketStateHandlers:
                     },
                 )
 
-            logger.info(f"✅ NFC tag override started for playlist {playlist_id} (session: {session_id})")
+            logger.info("✅ NFC tag override started for playlist %s (session: %s)", playlist_id, session_id)
 
         # Connection health monitoring
         @self.sio.on("client_ping")
         @handle_http_errors()
         async def handle_client_ping(sid, data):
             """Handle client ping for connection health monitoring."""
+            now = time.time()
             await self.sio.emit(
                 "client_pong",
                 {
-                    "timestamp": data.get("timestamp", time.time()),
-                    "server_time": time.time(),
-                    "server_seq": self.state_manager.get_global_sequence(),
+                    "timestamp": data.get("timestamp", now),
+                    "server_time": now,
+                    "server_seq": self._get_global_seq(),
                 },
                 room=sid,
             )
@@ -357,21 +473,23 @@ class WebSocketStateHandlers:
         @handle_http_errors()
         async def handle_health_check(sid, data):
             """Handle client health check request."""
-            health_metrics = await self.state_manager.get_health_metrics()
-            health_metrics.update(
+            health_metrics = await self._get_health_metrics()
+            await self.sio.emit(
+                "health_status",
                 {
-                    "connected_clients": len(self.sio.manager.rooms.get("/", {})),
+                    **health_metrics,
+                    "connected_clients": self._connected_clients,
                     "server_time": time.time(),
-                }
+                },
+                room=sid,
             )
-            await self.sio.emit("health_status", health_metrics, room=sid)
 
         # Post-connection state synchronization
         @self.sio.on("client:request_current_state")
         @handle_http_errors()
         async def handle_request_current_state(sid, data=None):
             """Handle client request for current state synchronization."""
-            logger.info(f"🔄 Client {sid} requesting current state sync")
+            logger.info("🔄 Client %s requesting current state sync", sid)
             # Get current player state and broadcast to specific client
             from app.src.dependencies import get_playback_coordinator, get_player_state_service
 
@@ -385,37 +503,25 @@ class WebSocketStateHandlers:
                         playback_coordinator, self.state_manager
                     )
 
-                    # Handle both PlayerStateModel and dict returns
-                    if hasattr(player_state, 'server_seq'):
-                        # PlayerStateModel case
-                        server_seq = player_state.server_seq
-                        data = player_state.model_dump()
-                        playlist_title = getattr(player_state, 'active_playlist_title', None)
-                    else:
-                        # dict case (fallback scenario)
-                        server_seq = player_state.get('server_seq', 0)
-                        data = player_state
-                        playlist_title = player_state.get('active_playlist_title', 'None')
+                    data, server_seq, playlist_title = _extract_player_state_info(player_state)
 
                     # Send current player state to requesting client
+                    now = time.time()
                     await self.sio.emit(
                         "state:player",
                         {
                             "event_type": "state:player",
                             "server_seq": server_seq,
                             "data": data,
-                            "timestamp": time.time(),
-                            "event_id": f"sync_{int(time.time() * 1000)}",
+                            "timestamp": now,
+                            "event_id": f"sync_{int(now * 1000)}",
                         },
                         room=sid,
                     )
-                    logger.info(f"✅ Sent current player state to client {sid}: {playlist_title}",
-                    )
+                    logger.info("✅ Sent current player state to client %s: %s", sid, playlist_title)
                 else:
-                    logger.warning(f"⚠️ No playback coordinator available for state sync to {sid}"
-                    )
+                    logger.warning("⚠️ No playback coordinator available for state sync to %s", sid)
             except Exception as e:
-                logger.error(f"❌ Error getting playback coordinator for state sync to {sid}: {e}"
-                )
+                logger.error("❌ Error getting playback coordinator for state sync to %s: %s", sid, e)
 
         logger.info("Server-authoritative WebSocket handlers registered successfully")
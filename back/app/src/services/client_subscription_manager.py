@@ -49,6 +49,9 @@ class ClientSubscriptionManager:
             return
 
         if room:
+            # Nothing to leave if the client never joined this room
+            if room not in self._client_subscriptions[client_id]:
+                return
             # Unsubscribe from specific room
             self._client_subscriptions[client_id].discard(room)
             if self.socketio:
@@ -8,7 +8,7 @@ import pytest
 from datetime import datetime, timezone
 
 from app.src.domain.nfc.entities.nfc_tag import NfcTag
-from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
+from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier, get_tag_identifier
 
 
 class TestNfcTag:
@@ -121,4 +121,26 @@ class TestNfcTag:
         
         # Can be used in sets
         tag_set = {tag1, tag2, tag3}
-        assert len(tag_set) == 2  # tag1 and tag2 are duplicates
\ No newline at end of file
+        assert len(tag_set) == 2  # tag1 and tag2 are duplicates
+
+class TestGetTagIdentifier:
+    """Test cases for the cached TagIdentifier factory."""
+
+    def test_returns_equal_identifier(self):
+        """Test factory returns an identifier equal to a direct construction."""
+        assert get_tag_identifier("abcd1234") == TagIdentifier(uid="abcd1234")
+
+    def test_reuses_instance_for_same_uid(self):
+        """Test repeated UIDs share the same immutable instance."""
+        assert get_tag_identifier("abcd1234") is get_tag_identifier("abcd1234")
+
+    def test_invalid_uid_still_raises(self):
+        """Test validation errors are raised and not cached."""
+        with pytest.raises(ValueError, match="Tag UID must be hexadecimal"):
+            get_tag_identifier("zzzz")
+        with pytest.raises(ValueError, match="Tag UID must be hexadecimal"):
+            get_tag_identifier("zzzz")
+
+    def test_identifier_has_no_instance_dict(self):
+        """Test TagIdentifier uses slots."""
+        assert not hasattr(TagIdentifier(uid="abcd1234"), "__dict__")
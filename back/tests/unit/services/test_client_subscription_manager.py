@@ -0,0 +1,60 @@
+"""Tests for ClientSubscriptionManager."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.src.services.client_subscription_manager import ClientSubscriptionManager
+
+
+@pytest.fixture
+def socketio():
+    """Mock Socket.IO server."""
+    sio = Mock()
+    sio.enter_room = AsyncMock()
+    sio.leave_room = AsyncMock()
+    return sio
+
+
+@pytest.fixture
+def manager(socketio):
+    """Subscription manager bound to the mock server."""
+    return ClientSubscriptionManager(socketio)
+
+
+@pytest.mark.asyncio
+class TestUnsubscribeClient:
+    """Test suite for room unsubscription."""
+
+    async def test_leaves_subscribed_room(self, manager, socketio):
+        """A subscribed room is left and forgotten."""
+        await manager.subscribe_client("sid-1", "playlists")
+
+        await manager.unsubscribe_client("sid-1", "playlists")
+
+        socketio.leave_room.assert_awaited_once_with("sid-1", "playlists")
+        assert not manager.is_client_subscribed("sid-1", "playlists")
+
+    async def test_unknown_room_is_noop(self, manager, socketio):
+        """Leaving a room the client never joined does not touch Socket.IO."""
+        await manager.subscribe_client("sid-1", "playlists")
+
+        await manager.unsubscribe_client("sid-1", "playlist:abc")
+
+        socketio.leave_room.assert_not_called()
+        assert manager.is_client_subscribed("sid-1", "playlists")
+
+    async def test_unknown_client_is_noop(self, manager, socketio):
+        """Leaving for a client without subscriptions does nothing."""
+        await manager.unsubscribe_client("sid-unknown", "playlists")
+
+        socketio.leave_room.assert_not_called()
+
+    async def test_unsubscribe_all_rooms(self, manager, socketio):
+        """Omitting the room leaves every subscribed room."""
+        await manager.subscribe_client("sid-1", "playlists")
+        await manager.subscribe_client("sid-1", "playlist:abc")
+
+        await manager.unsubscribe_client("sid-1")
+
+        assert socketio.leave_room.await_count == 2
+        assert manager.get_client_subscriptions("sid-1") == set()
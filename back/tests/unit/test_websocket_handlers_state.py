@@ -0,0 +1,276 @@
+"""Tests for WebSocketStateHandlers helpers and handler behaviour."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.src.common.data_models import PlayerStateModel, PlaybackState
+from app.src.routes.factories.websocket_handlers_state import (
+    WebSocketStateHandlers,
+    _NFCLinkRequest,
+    _calculate_expires_at,
+    _extract_player_state_info,
+)
+
+
+@pytest.fixture
+def handlers():
+    """Create WebSocket handlers with a mocked Socket.IO server and state manager."""
+    sio = Mock()
+    sio.emit = AsyncMock()
+    state_manager = Mock()
+    state_manager.get_global_sequence = Mock(return_value=1)
+    state_manager.send_acknowledgment = AsyncMock()
+    return WebSocketStateHandlers(sio, Mock(), state_manager)
+
+
+@pytest.fixture
+def registered(handlers):
+    """Register the handlers and return them keyed by event name."""
+    captured = {}
+
+    def capture_event(func):
+        captured[func.__name__] = func
+        return func
+
+    def capture_on(event_name):
+        def decorator(func):
+            captured[event_name] = func
+            return func
+        return decorator
+
+    handlers.sio.event = capture_event
+    handlers.sio.on = capture_on
+    handlers.register()
+    return captured
+
+
+class TestCalculateExpiresAt:
+    """Test suite for the override session expiry helper."""
+
+    def test_parses_utc_offset_timestamp(self):
+        """Offset-aware ISO timestamps are converted to epoch seconds."""
+        timeout_at = datetime(2025, 1, 1, 12, 0, 30, 250000, tzinfo=timezone.utc)
+
+        assert _calculate_expires_at(timeout_at.isoformat()) == timeout_at.timestamp()
+
+    def test_parses_zulu_suffix(self):
+        """A trailing 'Z' is treated as UTC."""
+        expected = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+
+        assert _calculate_expires_at("2025-01-01T12:00:00Z") == expected
+
+    def test_parses_non_utc_offset(self):
+        """Non-UTC offsets are honoured."""
+        tz = timezone(timedelta(hours=2))
+        timeout_at = datetime(2025, 6, 1, 8, 15, 0, tzinfo=tz)
+
+        assert _calculate_expires_at(timeout_at.isoformat()) == timeout_at.timestamp()
+
+    def test_missing_timeout_uses_default(self):
+        """Without a timeout the default window from now is used."""
+        before = time.time()
+        expires_at = _calculate_expires_at(None)
+
+        assert before + 60 <= expires_at <= time.time() + 60
+
+
+class TestNFCLinkRequest:
+    """Test suite for NFC link event payload validation."""
+
+    def test_from_dict_reads_all_fields(self):
+        """All known fields are extracted."""
+        request = _NFCLinkRequest.from_dict(
+            {"playlist_id": "p1", "client_op_id": "op-1", "tag_id": "04aabbcc"}
+        )
+
+        assert request == _NFCLinkRequest("p1", "op-1", "04aabbcc")
+
+    def test_optional_fields_default_to_none(self):
+        """client_op_id and tag_id are optional."""
+        request = _NFCLinkRequest.from_dict({"playlist_id": "p1"})
+
+        assert request.client_op_id is None
+        assert request.tag_id is None
+
+    @pytest.mark.parametrize("data", [{}, {"playlist_id": ""}, None])
+    def test_missing_playlist_id_raises(self, data):
+        """A missing playlist_id is rejected."""
+        with pytest.raises(ValueError, match="playlist_id is required"):
+            _NFCLinkRequest.from_dict(data)
+
+
+class TestExtractPlayerStateInfo:
+    """Test suite for the state:player payload extraction helper."""
+
+    def test_model_is_dumped(self):
+        """A PlayerStateModel is serialized and its sequence and title read."""
+        player_state = PlayerStateModel(
+            is_playing=True,
+            state=PlaybackState.PLAYING,
+            active_playlist_title="Mix",
+            server_seq=7,
+        )
+
+        data, server_seq, playlist_title = _extract_player_state_info(player_state)
+
+        assert data == player_state.model_dump()
+        assert server_seq == 7
+        assert playlist_title == "Mix"
+
+    def test_dict_is_passed_through(self):
+        """A fallback dict is forwarded as-is with defaults for missing keys."""
+        player_state = {"is_playing": False}
+
+        data, server_seq, playlist_title = _extract_player_state_info(player_state)
+
+        assert data is player_state
+        assert server_seq == 0
+        assert playlist_title == "None"
+
+
+@pytest.mark.asyncio
+class TestNFCAssociationStateDedup:
+    """Test suite for nfc_association_state duplicate suppression."""
+
+    async def test_identical_state_is_sent_once(self, handlers):
+        """A repeat of the same state to the same client is dropped."""
+        payload = {"state": "cancelled", "playlist_id": "p1", "server_seq": 1}
+
+        await handlers._emit_nfc_association_state(payload, "sid-1")
+        await handlers._emit_nfc_association_state({**payload, "server_seq": 2}, "sid-1")
+
+        handlers.sio.emit.assert_called_once_with("nfc_association_state", payload, room="sid-1")
+
+    async def test_changed_state_is_sent(self, handlers):
+        """A different state is always emitted."""
+        await handlers._emit_nfc_association_state({"state": "activated", "playlist_id": "p1"}, "sid-1")
+        await handlers._emit_nfc_association_state({"state": "cancelled", "playlist_id": "p1"}, "sid-1")
+
+        assert handlers.sio.emit.call_count == 2
+
+    async def test_same_state_to_other_client_is_sent(self, handlers):
+        """Deduplication is tracked per client."""
+        payload = {"state": "cancelled", "playlist_id": "p1"}
+
+        await handlers._emit_nfc_association_state(payload, "sid-1")
+        await handlers._emit_nfc_association_state(payload, "sid-2")
+
+        assert handlers.sio.emit.call_count == 2
+
+    async def test_repeat_after_window_is_sent(self, handlers):
+        """The same state is emitted again once the window has elapsed."""
+        payload = {"state": "cancelled", "playlist_id": "p1"}
+
+        await handlers._emit_nfc_association_state(payload, "sid-1")
+        key, sent_at = handlers._last_nfc_state["sid-1"]
+        handlers._last_nfc_state["sid-1"] = (key, sent_at - 1.0)
+        await handlers._emit_nfc_association_state(payload, "sid-1")
+
+        assert handlers.sio.emit.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestOverrideTagProcessing:
+    """Test suite for background tag processing in override_nfc_tag."""
+
+    async def test_ack_is_sent_before_tag_processing_finishes(self, handlers, registered):
+        """The override ack does not wait for tag detection to complete."""
+        release = asyncio.Event()
+
+        async def slow_detection(tag_identifier):
+            await release.wait()
+
+        nfc_service = Mock()
+        nfc_service.start_association_use_case = AsyncMock(
+            return_value={"session": {"session_id": "s1", "timeout_at": None}}
+        )
+        nfc_service._handle_tag_detection = AsyncMock(side_effect=slow_detection)
+        handlers.app.application._nfc_app_service = nfc_service
+
+        await registered["override_nfc_tag"](
+            "sid-1", {"playlist_id": "p1", "tag_id": "04aabbcc", "client_op_id": "op-1"}
+        )
+
+        handlers.state_manager.send_acknowledgment.assert_awaited_once()
+        assert len(handlers._background_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*handlers._background_tasks)
+
+        nfc_service._handle_tag_detection.assert_awaited_once()
+        assert not handlers._background_tasks
+
+
+@pytest.mark.asyncio
+class TestSyncRequest:
+    """Test suite for sync:request handling."""
+
+    async def test_snapshot_failure_does_not_block_other_rooms(self, handlers, registered):
+        """A failing room snapshot is logged and the remaining rooms still sync."""
+        handlers.state_manager.get_global_sequence.return_value = 5
+        handlers.state_manager.get_client_subscriptions = Mock(return_value={"playlists", "nfc"})
+
+        async def send_snapshot(sid, room):
+            if room == "nfc":
+                raise RuntimeError("boom")
+
+        handlers.state_manager._send_state_snapshot = AsyncMock(side_effect=send_snapshot)
+
+        await registered["sync:request"]("sid-1", {"last_global_seq": 1})
+
+        assert handlers.state_manager._send_state_snapshot.await_count == 2
+        handlers.state_manager.get_client_subscriptions.assert_called_once_with("sid-1")
+        event, payload = handlers.sio.emit.call_args.args
+        assert event == "sync:complete"
+        assert payload["current_global_seq"] == 5
+        assert sorted(payload["synced_rooms"]) == ["nfc", "playlists"]
+
+
+@pytest.mark.asyncio
+class TestConnectedClientCount:
+    """Test suite for the connected client counter reported by health_check."""
+
+    async def test_health_check_reports_connected_clients(self, handlers, registered):
+        """connect/disconnect keep the count that health_check reports."""
+        handlers.state_manager.get_health_metrics = AsyncMock(return_value={})
+        handlers.state_manager.unsubscribe_client = AsyncMock()
+
+        await registered["connect"]("sid-1", {})
+        await registered["connect"]("sid-2", {})
+        await registered["disconnect"]("sid-1")
+        await registered["health_check"]("sid-2", {})
+
+        event, payload = handlers.sio.emit.call_args.args
+        assert event == "health_status"
+        assert payload["connected_clients"] == 1
+        await asyncio.gather(*handlers._background_tasks)
+
+
+@pytest.mark.asyncio
+class TestHealthMetricsSnapshot:
+    """Test suite for health metrics reuse across health_check requests."""
+
+    async def test_metrics_are_reused_within_ttl(self, handlers, registered):
+        """Back-to-back health checks collect metrics once."""
+        handlers.state_manager.get_health_metrics = AsyncMock(return_value={"status": "ok"})
+
+        await registered["health_check"]("sid-1", {})
+        await registered["health_check"]("sid-2", {})
+
+        handlers.state_manager.get_health_metrics.assert_awaited_once()
+        assert handlers.sio.emit.call_args.args[1]["status"] == "ok"
+
+    async def test_metrics_are_refreshed_after_ttl(self, handlers, registered):
+        """Metrics are collected again once the snapshot has expired."""
+        handlers.state_manager.get_health_metrics = AsyncMock(return_value={"status": "ok"})
+
+        await registered["health_check"]("sid-1", {})
+        metrics, collected_at = handlers._health_snapshot
+        handlers._health_snapshot = (metrics, collected_at - 5.0)
+        await registered["health_check"]("sid-1", {})
+
+        assert handlers.state_manager.get_health_metrics.await_count == 2